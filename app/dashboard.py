@@ -2,70 +2,181 @@
 import argparse
 import json
 import os
+import re
 import sys
 import yaml
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+
+try:
+    # LibYAML C bindings; much faster than the pure-Python loader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    # Rust-backed JSON parser/serializer; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     sys.exit("ERROR: requests library not installed. Run: pip install -r app/requirements.txt")
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 APP_DIR = os.path.dirname(__file__)
 
+# Matches KEY=VALUE lines; comments and blanks simply don't match
+_ENV_LINE = re.compile(r"(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$")
+
 def load_env_file(env_path):
     """
     Load .env file and set environment variables.
-    Simple parser: handles KEY=VALUE lines, ignores comments and blanks.
+    Single regex pass over the whole file instead of a per-line Python
+    loop; handles KEY=VALUE lines, ignores comments and blanks.
+    Variables already in the environment take precedence.
     """
     if not os.path.exists(env_path):
         return
-    
+
     try:
         with open(env_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Only set if not already in environment (env vars take precedence)
-                    if key not in os.environ:
-                        os.environ[key] = value
+            text = f.read()
     except Exception as e:
         print(f"[WARN] Could not load .env file: {e}")
+        return
+
+    for match in _ENV_LINE.finditer(text):
+        os.environ.setdefault(match.group(1), match.group(2))
 
+def _open_rb(path):
+    """
+    Open for binary reading, with O_NOATIME where the platform (and
+    file ownership) allows so hot-path reads don't dirty the inode.
+    Both json.load and yaml.load accept bytes and decode in C.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags)
+    except PermissionError:
+        # O_NOATIME requires file ownership; retry without it
+        fd = os.open(path, os.O_RDONLY)
+    return os.fdopen(fd, "rb")
+
+@lru_cache(maxsize=1)
 def load_config():
-    path = os.path.join(APP_DIR, "config.yaml")
-    with open(path, "r") as f:
-        return yaml.safe_load(f)
+    """
+    Load config.yaml, using a JSON sidecar cache when it is fresh.
+    json.load is much faster than PyYAML, so we keep a parsed copy in
+    config.yaml.json and only re-parse the YAML when it has changed.
+
+    Cached for the lifetime of the process — callers must not mutate
+    the returned dict.
+    """
+    yaml_path = os.path.join(APP_DIR, "config.yaml")
+    cache_path = yaml_path + ".json"
+
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(yaml_path):
+        try:
+            with _open_rb(cache_path) as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass  # stale or unreadable cache; fall through to YAML
+
+    with _open_rb(yaml_path) as f:
+        cfg = yaml.load(f, Loader=_SafeLoader)
+
+    # Refresh the sidecar: write to temp, then rename (atomic).
+    # Best-effort — YAML can hold values json can't serialize (e.g.
+    # unquoted dates), in which case we just skip the cache.
+    temp_path = cache_path + ".tmp"
+    try:
+        with open(temp_path, "w") as f:
+            json.dump(cfg, f)
+        os.replace(temp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    return cfg
+
+@dataclass(slots=True, frozen=True)
+class IndicatorEntry:
+    """One indicator row in latest.json. Slots keep the per-entry
+    footprint small once dozens of indicators are configured."""
+    key: str
+    label: str
+    source: str
+    timestamp: str
+    value: float | None
+    unit: str
+    signal: str
+    notes: str
+
+def _json_default(obj):
+    """default= hook so IndicatorEntry serializes like the old dict."""
+    if isinstance(obj, IndicatorEntry):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 def ensure_dir(path):
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 def now_utc():
-    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+    # Single C call; also sidesteps the datetime.utcnow() deprecation
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-def determine_status(score, cfg):
-    if score <= cfg["scoring"]["green_max"]:
+def scoring_thresholds(cfg):
+    """Unpack cfg["scoring"] into a (green_max, yellow_max) tuple."""
+    return cfg["scoring"]["green_max"], cfg["scoring"]["yellow_max"]
+
+def determine_status(score, green_max, yellow_max):
+    # Callers should unpack thresholds once via scoring_thresholds()
+    # rather than paying two nested dict lookups per score
+    if score <= green_max:
         return "green"
-    if score <= cfg["scoring"]["yellow_max"]:
+    if score <= yellow_max:
         return "yellow"
     return "red"
 
-def fetch_fred_series(series_id, api_key, timeout=15, max_retries=2):
+# Statuses the mounted Retry policy may retry; everything else in the
+# 4xx/5xx range fails immediately without any backoff sleep
+_RETRIABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def _should_retry(status):
+    return status in _RETRIABLE_STATUSES
+
+def fetch_fred_series(series_id, api_key, session, timeout=15, cache_dir=None, cache_ttl=0):
     """
     Fetch latest observation from FRED series.
+    Uses the given requests.Session so consecutive calls reuse the
+    keep-alive connection instead of redoing the TCP+TLS handshake;
+    retries for 429/5xx are handled by the Retry policy mounted on it.
+    When cache_dir and cache_ttl are set, a recent result is served from
+    disk without an HTTP call — slow-moving series (e.g. monthly UNRATE)
+    don't need a fresh fetch on every daily cron run.
     Returns (value, obs_date) on success, (None, None) on error.
     """
+    cache_path = None
+    if cache_dir and cache_ttl > 0:
+        cache_path = os.path.join(cache_dir, series_id + ".json")
+        try:
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if time.time() - cached["fetched_at"] < cache_ttl:
+                return cached["value"], cached["date"], None
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # missing or corrupt cache; fall through to fetch
+
     if not api_key:
         return None, None, "FRED API key not configured (set FRED_API_KEY env var)"
-    
+
     url = "https://api.stlouisfed.org/fred/series/observations"
     params = {
         "series_id": series_id,
@@ -74,81 +185,121 @@ def fetch_fred_series(series_id, api_key, timeout=15, max_retries=2):
         "limit": 1,
         "sort_order": "desc"
     }
-    
-    for attempt in range(max_retries):
-        try:
-            resp = requests.get(url, params=params, timeout=timeout)
-            
-            # Check HTTP status
-            if resp.status_code == 400:
-                return None, None, "FRED API: Invalid request (check series_id)"
-            elif resp.status_code == 401:
-                return None, None, "FRED API: Invalid API key (set FRED_API_KEY)"
-            elif resp.status_code == 429:
-                error_msg = f"FRED API: Rate limited (attempt {attempt+1}/{max_retries})"
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** (attempt + 2))
-                    continue
-                return None, None, error_msg
-            elif resp.status_code >= 400:
-                error_msg = f"FRED API: HTTP {resp.status_code} (attempt {attempt+1}/{max_retries})"
-                if 500 <= resp.status_code < 600 and attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-                return None, None, error_msg
-            
-            resp.raise_for_status()
+
+    try:
+        resp = session.get(url, params=params, timeout=timeout)
+    except requests.exceptions.Timeout:
+        return None, None, "FRED API timeout"
+    except requests.exceptions.ConnectionError:
+        return None, None, "FRED API: Connection error"
+    except requests.exceptions.RetryError:
+        return None, None, "FRED API: Retries exhausted"
+    except requests.exceptions.RequestException as e:
+        return None, None, f"FRED API error: {str(e)}"
+
+    # Check HTTP status; retriable statuses arriving here mean the
+    # Retry policy already exhausted its attempts
+    status = resp.status_code
+    if status == 400:
+        return None, None, "FRED API: Invalid request (check series_id)"
+    if status == 401:
+        return None, None, "FRED API: Invalid API key (set FRED_API_KEY)"
+    if status == 429:
+        return None, None, "FRED API: Rate limited (retries exhausted)"
+    if status >= 400:
+        if _should_retry(status):
+            return None, None, f"FRED API: HTTP {status} (retries exhausted)"
+        return None, None, f"FRED API: HTTP {status}"
+
+    try:
+        if orjson is not None:
+            data = orjson.loads(resp.content)
+        else:
             data = resp.json()
-            
-            obs = data.get("observations", [])
-            if not obs:
-                return None, None, "No observations returned from FRED"
-            
-            latest = obs[0]
-            value_str = latest.get("value")
-            
-            if value_str == "." or not value_str:
-                return None, None, "Latest observation is missing/NA"
-            
-            try:
-                value = float(value_str)
-                date = latest.get("date", "")
-                return value, date, None
-            except ValueError:
-                return None, None, f"Could not parse value: {value_str}"
-        
-        except requests.exceptions.Timeout:
-            error_msg = f"FRED API timeout (attempt {attempt+1}/{max_retries})"
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
-            return None, None, error_msg
-        except requests.exceptions.ConnectionError as e:
-            error_msg = f"FRED API: Connection error (attempt {attempt+1}/{max_retries})"
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
-                continue
-            return None, None, error_msg
-        except requests.exceptions.RequestException as e:
-            return None, None, f"FRED API error: {str(e)}"
-        except (json.JSONDecodeError, ValueError) as e:
-            error_msg = f"Invalid JSON from FRED: {str(e)} (attempt {attempt+1}/{max_retries})"
-            if attempt < max_retries - 1:
-                time.sleep(1)
-                continue
-            return None, None, error_msg
-    
-    return None, None, "Max retries exceeded"
+    except (json.JSONDecodeError, ValueError) as e:
+        return None, None, f"Invalid JSON from FRED: {str(e)}"
+
+    obs = data.get("observations", [])
+    if not obs:
+        return None, None, "No observations returned from FRED"
+
+    latest = obs[0]
+    value_str = latest.get("value")
+
+    if value_str == "." or not value_str:
+        return None, None, "Latest observation is missing/NA"
+
+    try:
+        value = float(value_str)
+    except ValueError:
+        return None, None, f"Could not parse value: {value_str}"
+
+    date = latest.get("date", "")
+
+    if cache_path:
+        # Same atomic temp+replace pattern as latest.json
+        temp_path = cache_path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump({"value": value, "date": date, "fetched_at": time.time()}, f)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    return value, date, None
+
+@lru_cache(maxsize=4096)
+def _signal(value, green_max, yellow_max):
+    # Values repeat heavily across observations in a trend window, so
+    # memoizing on (value, green_max, yellow_max) gets high hit rates
+    if value <= green_max:
+        return "green"
+    if value <= yellow_max:
+        return "yellow"
+    return "red"
 
 def get_signal_for_value(value, thresholds):
     """Determine signal color based on value and thresholds."""
     if value is None:
         return "unknown"
-    if value <= thresholds.get("green_max", float("inf")):
-        return "green"
-    if value <= thresholds.get("yellow_max", float("inf")):
-        return "yellow"
-    return "red"
+    return _signal(
+        value,
+        thresholds.get("green_max", float("inf")),
+        thresholds.get("yellow_max", float("inf"))
+    )
+
+@lru_cache(maxsize=4)
+def _payload_template(project, mode):
+    """
+    Pre-serialized payload skeleton with sentinels for the per-run
+    fields. Everything except timestamp and indicators is static per
+    mode, so the static subtree is serialized once per process.
+    """
+    skeleton = {
+        "project": project,
+        "mode": mode,
+        "timestamp": "__TS__",
+        "indicators": "__IND__",
+        "meta": {
+            "version": 1,
+            "generated_by": "dashboard.py"
+        }
+    }
+    if orjson is not None:
+        return orjson.dumps(skeleton).decode("utf-8")
+    return json.dumps(skeleton, separators=(",", ":"))
+
+def render_payload(project, mode, ts_now, indicators):
+    """Splice the per-run fields into the cached payload template."""
+    if orjson is not None:
+        ind = orjson.dumps(indicators, default=_json_default).decode("utf-8")
+    else:
+        ind = json.dumps(indicators, separators=(",", ":"), default=_json_default)
+    # Timestamp first: after the indicator splice the string may
+    # contain arbitrary note text
+    body = _payload_template(project, mode).replace('"__TS__"', f'"{ts_now}"')
+    return body.replace('"__IND__"', ind)
 
 def run_dashboard(mode):
     """
@@ -164,67 +315,104 @@ def run_dashboard(mode):
     out_cfg = cfg["output"]
     data_dir = os.path.join(BASE_DIR, out_cfg["data_dir"])
     ensure_dir(data_dir)
+
+    cache_dir = os.path.join(data_dir, ".cache", "fred")
+    ensure_dir(cache_dir)
     
     # Get API key from environment (.env or system env vars)
     fred_api_key = os.environ.get("FRED_API_KEY")
-    
-    # Build indicators array
+
+    # Shared session so all indicator fetches reuse one connection.
+    # Retries for 429/5xx (honoring Retry-After) happen inside urllib3
+    # instead of a hand-rolled sleep loop in fetch_fred_series.
+    retry = Retry(
+        total=2,
+        backoff_factor=1,
+        status_forcelist=_RETRIABLE_STATUSES,
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+
+    # Fetch all enabled indicators concurrently. The work is pure
+    # network wait, so wall time drops to roughly the slowest fetch
+    # instead of the sum of all of them.
+    indicator_cfgs = [(key, icfg) for key, icfg in cfg.get("indicators", {}).items() if icfg]
+
     indicators = []
-    
-    # Fetch UNRATE
-    unrate_cfg = cfg.get("indicators", {}).get("unrate")
-    if unrate_cfg:
-        print(f"[*] Fetching {unrate_cfg['label']}...")
-        value, obs_date, error = fetch_fred_series(
-            unrate_cfg["series_id"],
-            fred_api_key,
-            timeout=15,
-            max_retries=2
-        )
-        
-        signal = get_signal_for_value(value, unrate_cfg.get("thresholds", {}))
-        
+    results = []
+    if indicator_cfgs:
+        with ThreadPoolExecutor(max_workers=min(8, len(indicator_cfgs))) as executor:
+            futures = []
+            for key, icfg in indicator_cfgs:
+                print(f"[*] Fetching {icfg['label']}...")
+                futures.append(executor.submit(
+                    fetch_fred_series,
+                    icfg["series_id"],
+                    fred_api_key,
+                    session,
+                    timeout=15,
+                    cache_dir=cache_dir,
+                    cache_ttl=icfg.get("cache_ttl_seconds", 0)
+                ))
+            results = [future.result() for future in futures]
+
+    # Timestamp once for the whole run; per-indicator lookups are
+    # hoisted to locals so the loop body stays cheap at scale
+    ts_now = now_utc()
+
+    for (key, icfg), (value, obs_date, error) in zip(indicator_cfgs, results):
+        label = icfg["label"]
+        signal = get_signal_for_value(value, icfg.get("thresholds", {}))
+
         if error:
             print(f"    [WARN] {error}")
         if value is not None:
-            print(f"    [OK] {unrate_cfg['label']} = {value}% ({signal})")
-        
-        indicator_entry = {
-            "key": "unrate",
-            "label": unrate_cfg["label"],
-            "source": unrate_cfg["source"],
-            "timestamp": obs_date if obs_date else now_utc(),
-            "value": round(value, 2) if value is not None else None,
-            "unit": "%",
-            "signal": signal,
-            "notes": error if error else unrate_cfg.get("notes", "")
-        }
+            print(f"    [OK] {label} = {value}% ({signal})")
+
+        indicator_entry = IndicatorEntry(
+            key=key,
+            label=label,
+            source=icfg["source"],
+            timestamp=obs_date if obs_date else ts_now,
+            value=round(value, 2) if value is not None else None,
+            unit="%",
+            signal=signal,
+            notes=error if error else icfg.get("notes", "")
+        )
         indicators.append(indicator_entry)
-    
-    # Build payload
-    payload = {
-        "project": cfg["project"]["name"],
-        "mode": mode,
-        "timestamp": now_utc(),
-        "indicators": indicators,
-        "meta": {
-            "version": 1,
-            "generated_by": "dashboard.py"
-        }
-    }
-    
+
+    session.close()
+
+    # Build payload (compact by default; indented output is the slow
+    # Python formatter path and only useful for humans)
+    body = render_payload(cfg["project"]["name"], mode, ts_now, indicators)
+    if os.environ.get("SOLON_PRETTY") == "1":
+        body = json.dumps(json.loads(body), indent=2)
+
     # Atomic write: write to temp, then rename
     latest_path = os.path.join(data_dir, out_cfg["latest_file"])
     temp_path = latest_path + ".tmp"
     
     try:
-        with open(temp_path, "w") as f:
-            json.dump(payload, f, indent=2)
-        
-        # Atomic rename
-        if os.path.exists(latest_path):
-            os.remove(latest_path)
-        os.rename(temp_path, latest_path)
+        with open(temp_path, "wb") as f:
+            f.write(body.encode("utf-8"))
+            # Flush data to disk before the rename so a crash can't
+            # leave an empty latest.json behind
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Atomic rename (os.replace overwrites in a single syscall)
+        os.replace(temp_path, latest_path)
+
+        # Persist the rename itself by syncing the directory entry
+        dir_fd = os.open(data_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
         
         print(f"[OK] Updated {latest_path}")
         print(f"[INFO] Indicators: {len(indicators)}, Mode: {mode}")